@@ -106,6 +106,85 @@ class ModelRecommendation(BaseModel):
     quality: str  # "good", "better", "best"
 
 
+# Model recommendations by function type (static, built once at import)
+_RECOMMENDATIONS_BY_FUNCTION_TYPE = {
+    "summarization": [
+        ModelRecommendation(
+            model_id="gpt-4o-mini",
+            reason="Best balance of speed, quality, and cost for summarization",
+            use_cases=["Article summaries", "Quick insights", "Bullet points"],
+            estimated_cost_per_1k=0.15,
+            speed="fast",
+            quality="better"
+        ),
+        ModelRecommendation(
+            model_id="llama3.1:8b",
+            reason="Free local model with good summarization quality",
+            use_cases=["Privacy-sensitive content", "High-volume processing"],
+            estimated_cost_per_1k=0.0,
+            speed="medium",
+            quality="good"
+        )
+    ],
+    "extraction": [
+        ModelRecommendation(
+            model_id="gpt-4o",
+            reason="Highest accuracy for complex entity extraction",
+            use_cases=["IOC extraction", "Structured data parsing"],
+            estimated_cost_per_1k=2.50,
+            speed="medium",
+            quality="best"
+        ),
+        ModelRecommendation(
+            model_id="llama3.1:8b",
+            reason="Good extraction accuracy at no cost",
+            use_cases=["Simple entity extraction", "Keyword extraction"],
+            estimated_cost_per_1k=0.0,
+            speed="medium",
+            quality="good"
+        )
+    ],
+    "analysis": [
+        ModelRecommendation(
+            model_id="gpt-4o",
+            reason="Best for deep analysis and reasoning",
+            use_cases=["Threat analysis", "Complex Q&A", "Research"],
+            estimated_cost_per_1k=2.50,
+            speed="slow",
+            quality="best"
+        ),
+        ModelRecommendation(
+            model_id="llama3.1:70b",
+            reason="High-quality local model for sensitive analysis",
+            use_cases=["Private analysis", "Compliance-sensitive data"],
+            estimated_cost_per_1k=0.0,
+            speed="slow",
+            quality="better"
+        )
+    ]
+}
+
+# Default recommendations for unknown function types
+_DEFAULT_RECOMMENDATIONS = [
+    ModelRecommendation(
+        model_id="gpt-4o-mini",
+        reason="Versatile model for general-purpose tasks",
+        use_cases=["General AI tasks", "Experimentation"],
+        estimated_cost_per_1k=0.15,
+        speed="fast",
+        quality="better"
+    ),
+    ModelRecommendation(
+        model_id="llama3.1:8b",
+        reason="Free local alternative",
+        use_cases=["Privacy-focused", "Cost optimization"],
+        estimated_cost_per_1k=0.0,
+        speed="medium",
+        quality="good"
+    )
+]
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -535,91 +614,13 @@ async def get_model_recommendations(
 
     Permissions: ADMIN_GENAI_VIEW
     """
-    # Model recommendations by function type
-    recommendations_map = {
-        "summarization": [
-            ModelRecommendation(
-                model_id="gpt-4o-mini",
-                reason="Best balance of speed, quality, and cost for summarization",
-                use_cases=["Article summaries", "Quick insights", "Bullet points"],
-                estimated_cost_per_1k=0.15,
-                speed="fast",
-                quality="better"
-            ),
-            ModelRecommendation(
-                model_id="llama3.1:8b",
-                reason="Free local model with good summarization quality",
-                use_cases=["Privacy-sensitive content", "High-volume processing"],
-                estimated_cost_per_1k=0.0,
-                speed="medium",
-                quality="good"
-            )
-        ],
-        "extraction": [
-            ModelRecommendation(
-                model_id="gpt-4o",
-                reason="Highest accuracy for complex entity extraction",
-                use_cases=["IOC extraction", "Structured data parsing"],
-                estimated_cost_per_1k=2.50,
-                speed="medium",
-                quality="best"
-            ),
-            ModelRecommendation(
-                model_id="llama3.1:8b",
-                reason="Good extraction accuracy at no cost",
-                use_cases=["Simple entity extraction", "Keyword extraction"],
-                estimated_cost_per_1k=0.0,
-                speed="medium",
-                quality="good"
-            )
-        ],
-        "analysis": [
-            ModelRecommendation(
-                model_id="gpt-4o",
-                reason="Best for deep analysis and reasoning",
-                use_cases=["Threat analysis", "Complex Q&A", "Research"],
-                estimated_cost_per_1k=2.50,
-                speed="slow",
-                quality="best"
-            ),
-            ModelRecommendation(
-                model_id="llama3.1:70b",
-                reason="High-quality local model for sensitive analysis",
-                use_cases=["Private analysis", "Compliance-sensitive data"],
-                estimated_cost_per_1k=0.0,
-                speed="slow",
-                quality="better"
-            )
-        ]
-    }
-
-    # Default recommendations for unknown function types
-    default_recommendations = [
-        ModelRecommendation(
-            model_id="gpt-4o-mini",
-            reason="Versatile model for general-purpose tasks",
-            use_cases=["General AI tasks", "Experimentation"],
-            estimated_cost_per_1k=0.15,
-            speed="fast",
-            quality="better"
-        ),
-        ModelRecommendation(
-            model_id="llama3.1:8b",
-            reason="Free local alternative",
-            use_cases=["Privacy-focused", "Cost optimization"],
-            estimated_cost_per_1k=0.0,
-            speed="medium",
-            quality="good"
-        )
-    ]
-
     # Try to match function name to type
     function_lower = function_name.lower()
-    for func_type, recommendations in recommendations_map.items():
+    for func_type, recommendations in _RECOMMENDATIONS_BY_FUNCTION_TYPE.items():
         if func_type in function_lower:
             return recommendations
 
-    return default_recommendations
+    return _DEFAULT_RECOMMENDATIONS
 
 
 @router.post("/{function_name}/reset-stats")
@@ -16,7 +16,7 @@ Features:
 Permissions: ADMIN_GENAI_VIEW, ADMIN_GENAI_EDIT
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 from app.core.database import get_db
 from app.auth.dependencies import require_permission
@@ -25,6 +25,7 @@ from app.models import Guardrail, PromptGuardrail, Prompt, User
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 import re
 
 router = APIRouter(prefix="/admin/genai-guardrails", tags=["admin-guardrails"])
@@ -178,20 +179,73 @@ GUARDRAIL_TYPES = {
     }
 }
 
+# GUARDRAIL_TYPES is static, so the /types response is built once at import
+_GUARDRAIL_TYPE_INFOS = [
+    GuardrailTypeInfo(
+        type=gtype,
+        description=info["description"],
+        example_config=info["example_config"]
+    )
+    for gtype, info in GUARDRAIL_TYPES.items()
+]
+
 
 # ============================================================================
 # Validation Service (Basic Implementation)
 # ============================================================================
 
+# Collapses any whitespace run (spaces, tabs, newlines) to a single space so
+# keyword checks cannot be dodged with "ignore\n\tprevious" style spacing.
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_for_match(text: str) -> str:
+    """Lowercase text and collapse whitespace for substring keyword matching."""
+    return _WHITESPACE_RE.sub(" ", text.lower())
+
+
+# Inputs longer than this bypass the keyword cache so it cannot pin large
+# prompts in memory; at 4096 entries the cache holds at most ~16M characters.
+_INJECTION_CACHE_MAX_INPUT = 4096
+
+
+def _find_injection_keywords(text: str, keywords: tuple) -> tuple:
+    """Return the configured keywords present in text (whitespace/case-insensitive)."""
+    normalized_text = _normalize_for_match(text)
+    return tuple(k for k in keywords if _normalize_for_match(k) in normalized_text)
+
+
+# Prompt-injection checks are pure over (input, keywords); re-runs and retries
+# of the same prompt hit this cache. Stats via _cached_injection_keywords.cache_info().
+_cached_injection_keywords = lru_cache(maxsize=4096)(_find_injection_keywords)
+
+# Every numeric PII pattern needs at least one digit to match
+_DIGIT_RE = re.compile(r"\d")
+
+
 class GuardrailValidator:
     """Service for validating input/output against guardrails."""
 
-    # PII regex patterns
+    # PII regex patterns, compiled once at import so scans skip re's compile cache.
+    # They spell out both letter cases where needed, so they are compiled
+    # without IGNORECASE and the engine does no case folding per character.
+    # Email quantifiers are capped at the RFC 5321 lengths (local part 64,
+    # domain 253, label 63) so untrusted feed text cannot drive unbounded
+    # backtracking between the overlapping character classes.
     PII_PATTERNS = {
-        "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        "phone": r'\b(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
-        "ssn": r'\b\d{3}-\d{2}-\d{4}\b',
-        "credit_card": r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'
+        "email": re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b'),
+        "phone": re.compile(r'\b(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'),
+        "ssn": re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),
+        "credit_card": re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b')
+    }
+
+    # Cheap literal prerequisites per PII type; a pattern whose prerequisite is
+    # absent from the text cannot match, so it is left out of the regex scan.
+    PII_PREFILTERS = {
+        "email": lambda text: "@" in text,
+        "phone": lambda text: _DIGIT_RE.search(text) is not None,
+        "ssn": lambda text: _DIGIT_RE.search(text) is not None,
+        "credit_card": lambda text: _DIGIT_RE.search(text) is not None,
     }
 
     @staticmethod
@@ -203,15 +257,21 @@ class GuardrailValidator:
         action_on_detect = config.get("action_on_detect", "block")
 
         for pattern_name in patterns_to_check:
-            if pattern_name in GuardrailValidator.PII_PATTERNS:
-                regex = GuardrailValidator.PII_PATTERNS[pattern_name]
-                matches = re.findall(regex, text, re.IGNORECASE)
-
-                if matches:
-                    violations.append(f"PII detected: {pattern_name}")
-
-                    if action_on_detect == "redact":
-                        sanitized = re.sub(regex, f"[{pattern_name.upper()}_REDACTED]", sanitized, flags=re.IGNORECASE)
+            if pattern_name not in GuardrailValidator.PII_PATTERNS:
+                continue
+            if not GuardrailValidator.PII_PREFILTERS[pattern_name](text):
+                continue
+
+            # Each type is detected against the original text on its own, so
+            # overlapping matches (an SSN inside an email local part) are all
+            # reported. search() stops at the first hit instead of collecting
+            # every match as findall did.
+            regex = GuardrailValidator.PII_PATTERNS[pattern_name]
+            if regex.search(text):
+                violations.append(f"PII detected: {pattern_name}")
+
+                if action_on_detect == "redact":
+                    sanitized = regex.sub(f"[{pattern_name.upper()}_REDACTED]", sanitized)
 
         passed = len(violations) == 0 or action_on_detect != "block"
         return passed, violations, sanitized if action_on_detect == "redact" else None
@@ -223,10 +283,14 @@ class GuardrailValidator:
         keywords = config.get("keywords", [])
         action_on_detect = config.get("action_on_detect", "block")
 
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                violations.append(f"Prompt injection keyword detected: {keyword}")
+        keywords = tuple(keywords)
+        if len(text) > _INJECTION_CACHE_MAX_INPUT:
+            detected = _find_injection_keywords(text, keywords)
+        else:
+            detected = _cached_injection_keywords(text, keywords)
+
+        for keyword in detected:
+            violations.append(f"Prompt injection keyword detected: {keyword}")
 
         passed = len(violations) == 0 or action_on_detect != "block"
         return passed, violations
@@ -271,43 +335,53 @@ class GuardrailValidator:
     @staticmethod
     def validate(guardrail_type: str, config: Dict, text: str) -> GuardrailTestResponse:
         """Main validation dispatcher."""
-        if guardrail_type == "pii":
-            passed, violations, sanitized = GuardrailValidator.validate_pii(text, config)
+        handler = _GUARDRAIL_HANDLERS.get(guardrail_type)
+        if handler is None:
+            # For unimplemented types, return placeholder
             return GuardrailTestResponse(
-                passed=passed,
-                violations=violations,
-                action_taken=config.get("action_on_detect"),
-                sanitized_output=sanitized
+                passed=True,
+                violations=[f"Validation for {guardrail_type} not yet implemented"]
             )
+        return handler(text, config)
 
-        elif guardrail_type == "prompt_injection":
-            passed, violations = GuardrailValidator.validate_prompt_injection(text, config)
-            return GuardrailTestResponse(
-                passed=passed,
-                violations=violations,
-                action_taken=config.get("action_on_detect")
-            )
 
-        elif guardrail_type == "length":
-            passed, violations = GuardrailValidator.validate_length(text, config)
-            return GuardrailTestResponse(
-                passed=passed,
-                violations=violations
-            )
+def _check_pii(text: str, config: Dict) -> GuardrailTestResponse:
+    passed, violations, sanitized = GuardrailValidator.validate_pii(text, config)
+    return GuardrailTestResponse(
+        passed=passed,
+        violations=violations,
+        action_taken=config.get("action_on_detect"),
+        sanitized_output=sanitized
+    )
 
-        elif guardrail_type == "keywords_forbidden":
-            passed, violations = GuardrailValidator.validate_keywords_forbidden(text, config)
-            return GuardrailTestResponse(
-                passed=passed,
-                violations=violations
-            )
 
-        else:
-            # For unimplemented types, return placeholder
-            return GuardrailTestResponse(
-                passed=True,
-                violations=[f"Validation for {guardrail_type} not yet implemented"]
-            )
+def _check_prompt_injection(text: str, config: Dict) -> GuardrailTestResponse:
+    passed, violations = GuardrailValidator.validate_prompt_injection(text, config)
+    return GuardrailTestResponse(
+        passed=passed,
+        violations=violations,
+        action_taken=config.get("action_on_detect")
+    )
+
+
+def _check_length(text: str, config: Dict) -> GuardrailTestResponse:
+    passed, violations = GuardrailValidator.validate_length(text, config)
+    return GuardrailTestResponse(passed=passed, violations=violations)
+
+
+def _check_keywords_forbidden(text: str, config: Dict) -> GuardrailTestResponse:
+    passed, violations = GuardrailValidator.validate_keywords_forbidden(text, config)
+    return GuardrailTestResponse(passed=passed, violations=violations)
+
+
+# Guardrail type -> handler, resolved once at import instead of walking an
+# if/elif chain of string compares on every validation call
+_GUARDRAIL_HANDLERS = {
+    "pii": _check_pii,
+    "prompt_injection": _check_prompt_injection,
+    "length": _check_length,
+    "keywords_forbidden": _check_keywords_forbidden,
+}
 
 
 # ============================================================================
@@ -323,26 +397,20 @@ async def list_guardrail_types(
 
     Permissions: ADMIN_GENAI_VIEW
     """
-    types = [
-        GuardrailTypeInfo(
-            type=gtype,
-            description=info["description"],
-            example_config=info["example_config"]
-        )
-        for gtype, info in GUARDRAIL_TYPES.items()
-    ]
-
-    return types
+    return _GUARDRAIL_TYPE_INFOS
 
 
 @router.post("/test", response_model=GuardrailTestResponse)
-async def test_guardrail(
+def test_guardrail(
     payload: GuardrailTestRequest,
     current_user: User = Depends(require_permission(Permission.ADMIN_GENAI_VIEW.value))
 ):
     """
     Test guardrail against sample input.
 
+    Declared sync so FastAPI runs the CPU-bound regex validation in its
+    threadpool instead of blocking the event loop.
+
     Permissions: ADMIN_GENAI_VIEW
     """
     if payload.guardrail_type not in GUARDRAIL_TYPES:
@@ -361,7 +429,7 @@ async def test_guardrail(
 
 
 @router.post("/validate", response_model=GuardrailValidationResponse)
-async def validate_input(
+def validate_input(
     payload: GuardrailValidationRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.ADMIN_GENAI_VIEW.value))
@@ -369,6 +437,9 @@ async def validate_input(
     """
     Validate input against all active guardrails for a prompt.
 
+    Declared sync so the blocking DB queries and regex validation run in
+    FastAPI's threadpool instead of on the event loop.
+
     Permissions: ADMIN_GENAI_VIEW
     """
     # Get prompt with guardrails
@@ -380,12 +451,20 @@ async def validate_input(
             detail=f"Prompt with ID {payload.prompt_id} not found"
         )
 
-    # Get active guardrails via join table
-    prompt_guardrails = db.query(PromptGuardrail).filter(
-        PromptGuardrail.prompt_id == payload.prompt_id
+    # Get the prompt's active guardrails in check order with one JOIN through
+    # the link table; inactive ones are dropped in SQL rather than in Python.
+    # Only the columns validation reads are selected, so no ORM entities are
+    # hydrated into the session identity map.
+    guardrails = db.query(
+        Guardrail.type, Guardrail.config, Guardrail.action
+    ).join(
+        PromptGuardrail, PromptGuardrail.guardrail_id == Guardrail.id
+    ).filter(
+        PromptGuardrail.prompt_id == payload.prompt_id,
+        Guardrail.is_active == True
     ).order_by(PromptGuardrail.order).all()
 
-    if not prompt_guardrails:
+    if not guardrails:
         return GuardrailValidationResponse(
             passed=True,
             violations=[],
@@ -396,11 +475,7 @@ async def validate_input(
     all_violations = []
     sanitized_text = payload.input_text
 
-    for pg in prompt_guardrails:
-        guardrail = db.query(Guardrail).filter(Guardrail.id == pg.guardrail_id).first()
-        if not guardrail or not guardrail.is_active:
-            continue
-
+    for guardrail in guardrails:
         result = GuardrailValidator.validate(
             guardrail.type,
             guardrail.config,
@@ -434,6 +509,8 @@ async def validate_input(
 async def list_guardrails(
     guardrail_type: Optional[str] = Query(None, description="Filter by type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size for keyset pagination"),
+    before_id: Optional[int] = Query(None, description="Return guardrails with ID below this cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.ADMIN_GENAI_VIEW.value))
 ):
@@ -443,6 +520,8 @@ async def list_guardrails(
     Query Parameters:
     - guardrail_type: Filter by type
     - is_active: Filter by active status
+    - limit: Page size; when paginating, results are newest-first by ID
+    - before_id: Cursor, pass the last ID of the previous page
 
     Permissions: ADMIN_GENAI_VIEW
     """
@@ -454,9 +533,19 @@ async def list_guardrails(
     if is_active is not None:
         query = query.filter(Guardrail.is_active == is_active)
 
-    guardrails = query.order_by(Guardrail.created_at.desc()).all()
+    if limit is None and before_id is None:
+        return query.order_by(Guardrail.created_at.desc()).all()
+
+    # Keyset pagination walks the primary-key index from the cursor, so each
+    # page costs the same regardless of depth and needs no OFFSET or COUNT
+    if before_id is not None:
+        query = query.filter(Guardrail.id < before_id)
 
-    return guardrails
+    query = query.order_by(Guardrail.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query.all()
 
 
 @router.post("/", response_model=GuardrailResponse, status_code=status.HTTP_201_CREATED)
@@ -477,9 +566,11 @@ async def create_guardrail(
             detail=f"Invalid guardrail type. Valid types: {list(GUARDRAIL_TYPES.keys())}"
         )
 
-    # Check for duplicate name
-    existing = db.query(Guardrail).filter(Guardrail.name == payload.name).first()
-    if existing:
+    # Check for duplicate name with SELECT EXISTS rather than loading the row
+    name_taken = db.query(
+        db.query(Guardrail).filter(Guardrail.name == payload.name).exists()
+    ).scalar()
+    if name_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Guardrail '{payload.name}' already exists"
@@ -606,15 +697,16 @@ async def list_prompt_guardrails(
             detail=f"Prompt with ID {prompt_id} not found"
         )
 
-    # Get prompt_guardrails with guardrail details
-    prompt_guardrails = db.query(PromptGuardrail).filter(
+    # Get prompt_guardrails with guardrail details, eager-loaded in the same query
+    prompt_guardrails = db.query(PromptGuardrail).options(
+        joinedload(PromptGuardrail.guardrail)
+    ).filter(
         PromptGuardrail.prompt_id == prompt_id
     ).order_by(PromptGuardrail.order).all()
 
-    # Manually load guardrail relationship
     results = []
     for pg in prompt_guardrails:
-        guardrail = db.query(Guardrail).filter(Guardrail.id == pg.guardrail_id).first()
+        guardrail = pg.guardrail
         if guardrail:
             results.append({
                 "id": pg.id,
@@ -640,14 +732,16 @@ async def attach_guardrail_to_prompt(
     Permissions: ADMIN_GENAI_EDIT
     """
     # Verify prompt exists
-    prompt = db.query(Prompt).filter(Prompt.id == prompt_id).first()
-    if not prompt:
+    prompt_exists = db.query(
+        db.query(Prompt).filter(Prompt.id == prompt_id).exists()
+    ).scalar()
+    if not prompt_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Prompt with ID {prompt_id} not found"
         )
 
-    # Verify guardrail exists
+    # Verify guardrail exists (the row is returned in the response)
     guardrail = db.query(Guardrail).filter(Guardrail.id == payload.guardrail_id).first()
     if not guardrail:
         raise HTTPException(
@@ -656,14 +750,16 @@ async def attach_guardrail_to_prompt(
         )
 
     # Check if already attached
-    existing = db.query(PromptGuardrail).filter(
-        and_(
-            PromptGuardrail.prompt_id == prompt_id,
-            PromptGuardrail.guardrail_id == payload.guardrail_id
-        )
-    ).first()
+    already_attached = db.query(
+        db.query(PromptGuardrail).filter(
+            and_(
+                PromptGuardrail.prompt_id == prompt_id,
+                PromptGuardrail.guardrail_id == payload.guardrail_id
+            )
+        ).exists()
+    ).scalar()
 
-    if existing:
+    if already_attached:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Guardrail already attached to this prompt"
@@ -2007,11 +2007,10 @@ async def update_function_guardrails(
     db: Session = Depends(get_db)
 ):
     """Update or create custom guardrails for a GenAI function."""
-    from app.genai.prompts import get_all_functions
     from app.models import AuditEventType
     
-    functions = get_all_functions()
-    # Allow custom function names for flexibility
+    # Custom function names are allowed for flexibility, so the name is not
+    # checked against the known function list
     
     # Validate guardrails
     for g in request.guardrails:
@@ -2044,8 +2043,6 @@ async def update_function_guardrails(
         )
         db.add(config)
     
-    db.commit()
-    
     # Audit log
     AuditManager.log_event(
         db=db,
@@ -2084,7 +2081,6 @@ async def reset_function_guardrails(
     
     if config:
         db.delete(config)
-        db.commit()
         
         AuditManager.log_event(
             db=db,
@@ -2265,18 +2261,16 @@ async def create_global_guardrail(
         )
         db.add(config)
     
-    db.commit()
-    
     # Audit log
     AuditManager.log_event(
         db=db,
         user_id=current_user.id,
         event_type=AuditEventType.SYSTEM_CONFIG,
-        action=f"Created global guardrail: {request.name} (ID: {request.guardrail_id})",
+        action=f"Created global guardrail: {request.name} (ID: {request.id})",
         resource_type="guardrails:global"
     )
     
-    logger.info("global_guardrail_created", guardrail_id=request.guardrail_id, user_id=current_user.id)
+    logger.info("global_guardrail_created", guardrail_id=request.id, user_id=current_user.id)
     
     return {"message": f"Global guardrail '{request.name}' created", "guardrail": new_guardrail}
 
@@ -2304,24 +2298,14 @@ async def update_global_guardrail(
     
     existing = json.loads(config.value)
     
+    # Fields left as None mean "unchanged", so only the provided ones are applied
+    changes = request.model_dump(exclude_none=True)
+    
     # Find and update the guardrail
     found = False
     for g in existing:
         if g.get("id") == guardrail_id:
-            if request.name is not None:
-                g["name"] = request.name
-            if request.description is not None:
-                g["description"] = request.description
-            if request.category is not None:
-                g["category"] = request.category
-            if request.severity is not None:
-                g["severity"] = request.severity
-            if request.enabled is not None:
-                g["enabled"] = request.enabled
-            if request.prompt_template is not None:
-                g["prompt_template"] = request.prompt_template
-            if request.validation_pattern is not None:
-                g["validation_pattern"] = request.validation_pattern
+            g.update(changes)
             g["updated_at"] = datetime.utcnow().isoformat()
             g["updated_by"] = current_user.id
             found = True
@@ -2335,7 +2319,6 @@ async def update_global_guardrail(
     
     config.value = json.dumps(existing)
     config.updated_by = current_user.id
-    db.commit()
     
     AuditManager.log_event(
         db=db,
@@ -2396,8 +2379,6 @@ async def toggle_global_guardrail(
             )
             db.add(override_config)
         
-        db.commit()
-        
         AuditManager.log_event(
             db=db,
             user_id=current_user.id,
@@ -2439,7 +2420,6 @@ async def toggle_global_guardrail(
         )
     
     config.value = json.dumps(existing)
-    db.commit()
     
     AuditManager.log_event(
         db=db,
@@ -2483,7 +2463,6 @@ async def delete_global_guardrail(
         )
     
     config.value = json.dumps(existing)
-    db.commit()
     
     AuditManager.log_event(
         db=db,
@@ -2561,8 +2540,6 @@ async def bulk_guardrail_action(
                 value=json.dumps(overrides)
             ))
     
-    db.commit()
-    
     AuditManager.log_event(
         db=db,
         user_id=current_user.id,
@@ -2651,8 +2628,6 @@ async def add_function_guardrail(
             value=json.dumps(existing)
         ))
     
-    db.commit()
-    
     AuditManager.log_event(
         db=db,
         user_id=current_user.id,
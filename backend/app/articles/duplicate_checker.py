@@ -15,6 +15,11 @@ from app.core.logging import logger
 
 logger = structlog.get_logger()
 
+# Common words that don't add meaning to a similarity comparison
+_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_URL_HOST_RE = re.compile(r'https?://([^/]+)')
+
 
 class DuplicateChecker:
     """
@@ -121,7 +126,8 @@ class DuplicateChecker:
         if content1 and content2:
             content_sim = self._text_similarity(
                 self._normalize_text(content1)[:1000],  # First 1000 chars
-                self._normalize_text(content2)[:1000]
+                self._normalize_text(content2)[:1000],
+                min_ratio=0.80
             )
             if content_sim >= 0.80:
                 scores.append(content_sim * 0.3)  # 30% weight
@@ -150,31 +156,33 @@ class DuplicateChecker:
             "reasoning": reasoning
         }
     
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate text similarity using SequenceMatcher."""
+    def _text_similarity(self, text1: str, text2: str, min_ratio: float = 0.0) -> float:
+        """
+        Calculate text similarity using SequenceMatcher.
+        
+        When min_ratio is set, pairs whose cheap upper bounds already fall
+        below it return 0.0 without running the full ratio() computation.
+        """
         if not text1 or not text2:
             return 0.0
         
         text1_clean = self._normalize_text(text1.lower())
         text2_clean = self._normalize_text(text2.lower())
         
-        return SequenceMatcher(None, text1_clean, text2_clean).ratio()
+        matcher = SequenceMatcher(None, text1_clean, text2_clean)
+        if min_ratio and (matcher.real_quick_ratio() < min_ratio or matcher.quick_ratio() < min_ratio):
+            return 0.0
+        return matcher.ratio()
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters
-        text = re.sub(r'[^\w\s]', '', text)
+        # Remove special characters; split()/join() below collapses whitespace
+        text = _SPECIAL_CHARS_RE.sub('', text)
         # Remove common words that don't add meaning
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        words = text.split()
-        words = [w for w in words if w.lower() not in stopwords]
-        
-        return ' '.join(words)
+        return ' '.join(w for w in text.split() if w.lower() not in _STOPWORDS)
     
     def _extract_domain(self, url: str) -> Optional[str]:
         """Extract domain from URL."""
@@ -182,7 +190,7 @@ class DuplicateChecker:
             return None
         
         try:
-            match = re.search(r'https?://([^/]+)', url)
+            match = _URL_HOST_RE.search(url)
             if match:
                 domain = match.group(1)
                 # Remove www. prefix
@@ -20,7 +20,11 @@ class AuditManager:
         correlation_id: str = None,
         ip_address: str = None
     ) -> AuditLog:
-        """Create an immutable audit log entry."""
+        """Create an immutable audit log entry.
+
+        Commits the session, so changes the caller staged beforehand are
+        committed in the same transaction as the entry.
+        """
         if correlation_id is None:
             correlation_id = str(uuid.uuid4())
         